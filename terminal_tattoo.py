@@ -5,24 +5,34 @@
 # Renders an image as specified
 # (c) Copyright 2021, Jamie Harding. All rights reserved.
 
-from PIL import Image, ImageDraw, ImageFont
-import argparse
 import logging
-import tempfile
-from os import path, get_terminal_size
-from sys import exit
-import pprint
+from functools import lru_cache
+from os import path, get_terminal_size, urandom
+import sys
+from types import SimpleNamespace
 import re
 
+### PIL IS IMPORTED ON FIRST USE, SO --help AND EARLY EXITS DON'T PAY FOR IT
+Image = None
+ImageDraw = None
+ImageFont = None
+
 ### SOME REASONABLE DEFAULTS
 DEFAULT_FONT = '/System/Library/Fonts/Menlo.ttc'
 DEFAULT_SIZE = 45
-DEFAULT_POS  = 'tR' # top right corner
-DEFAULT_FGC  = 'fK' # black
-DEFAULT_BGC  = 'bW' # white
+DEFAULT_POS  = 'pTR' # top right corner
+DEFAULT_FGC  = 'K' # black
+DEFAULT_BGC  = 'W' # white
 
 ### I USE THESE IN A BUNCH OF PLACES AND I DON'T WANT TO KEEP TYPING IT
-POSITION_CODES = ['pT', 'pTL', 'pTR', 'pB', 'pBL', 'pBR', 'pC', 'pL', 'pR']
+POSITION_CODES = ('pT', 'pTL', 'pTR', 'pB', 'pBL', 'pBR', 'pC', 'pL', 'pR')
+
+### NAMED COLORS (--fg/--bg) TO HTML HEX
+_COLOR_HEX = {'R': 'FF0000', 'G': '00FF00', 'B': '0000FF', 'W': 'FFFFFF', 'K': '000000', 'C': '00FFFF', 'M': 'FF00FF', 'Y': 'FFFF00', 'gray': 'A9A9A9'}
+
+### COMPILED ONCE, USED ON EVERY COLOR PARSE
+_VALIDATE_RE = re.compile(r'#?[0-9a-fA-F]{6}')
+_SANITIZE_RE = re.compile(r'#?([0-9a-fA-F]{6})')
 
 ### EMPIRICAL LINEAR TRANSFORMATION FROM CHARACTER GRID TO PIXELS
 RETINA_HCELL_PIXELS = 14
@@ -40,10 +50,10 @@ EXIT_CATASTROPHIC_ERROR = -10
 # logging stuff:
 ##############################################################################
 class ColorizingStreamHandler(logging.StreamHandler):
-    @property
-    def is_tty(self):
+    def __init__(self, stream=None):
+        logging.StreamHandler.__init__(self, stream)
         isatty = getattr(self.stream, 'isatty', None)
-        return isatty
+        self.is_tty = bool(isatty and isatty())
 
     def emit(self, record):
         # noinspection PyBroadException
@@ -65,9 +75,10 @@ class ColorizingStreamHandler(logging.StreamHandler):
         message = logging.StreamHandler.format(self, record)
         if self.is_tty:
             # Don't colorize traceback
-            parts = message.split('\n', 1)
-            parts[0] = self.colorize(parts[0], record)
-            message = '\n'.join(parts)
+            idx = message.find('\n')
+            if idx < 0:
+                return self.colorize(message, record)
+            return self.colorize(message[:idx], record) + message[idx:]
         return message
 
     # color names to partial ANSI code (there'll be math later to make complete codes)
@@ -96,21 +107,25 @@ class ColorizingStreamHandler(logging.StreamHandler):
     reset = '\x1b[0m'
 
     def colorize(self, message, record):
-        if record.levelno in self.level_map:
-            bg, fg, bold = self.level_map[record.levelno]
-            params = []
-            if bg in self.color_map:
-                params.append(str(self.color_map[bg] + 40))
-            if fg in self.color_map:
-                params.append(str(self.color_map[fg] + 30))
-            if bold:
-                params.append('1')
-            if params:
-                message = ''.join((self.csi, ';'.join(params), 'm', message, self.reset))
-        return message
+        pfx = self._level_prefix.get(record.levelno)
+        return f"{pfx}{message}{self.reset}" if pfx else message
 
     def output_colorized(self, message):
         self.stream.write(message)
+
+    # the complete ANSI prefix for each level never changes, so build it once
+    _level_prefix = {}
+    for (_level, (_bg, _fg, _bold)) in level_map.items():
+        _params = []
+        if _bg in color_map:
+            _params.append(str(color_map[_bg] + 40))
+        if _fg in color_map:
+            _params.append(str(color_map[_fg] + 30))
+        if _bold:
+            _params.append('1')
+        if _params:
+            _level_prefix[_level] = ''.join((csi, ';'.join(_params), 'm'))
+    del _level, _bg, _fg, _bold, _params
 # End Class ColorizingStreamHandler
 
 
@@ -123,8 +138,6 @@ handler = ColorizingStreamHandler()
 handler.setFormatter(formatter)
 Logger.addHandler(handler)
 
-pp = pprint.PrettyPrinter(indent=4)
-
 ##############################################################################
 # main:
 ##############################################################################
@@ -133,21 +146,21 @@ def main():
     parser = config_parser()
     args = parser.parse_args()
 
-    if None == args.verbose:
-        Logger.setLevel(logging.ERROR)
-        handler.setLevel(logging.ERROR)
+    v = args.verbose
+    if v is None or v < 1:
+        level = logging.ERROR
+    elif v == 1:
+        level = logging.WARNING
+    elif v == 2:
+        level = logging.INFO
     else:
-        if args.verbose > 0:
-            Logger.setLevel(logging.WARNING)
-            handler.setLevel(logging.WARNING)
-        if args.verbose > 1:
-            Logger.setLevel(logging.INFO)
-            handler.setLevel(logging.INFO)
-        if args.verbose > 2:
-            Logger.setLevel(logging.DEBUG)
-            handler.setLevel(logging.DEBUG)
-            Logger.debug("parsed args:")
-            pp.pprint(args)
+        level = logging.DEBUG
+    Logger.setLevel(level)
+    handler.setLevel(level)
+    if level == logging.DEBUG:
+        Logger.debug("parsed args:")
+        import pprint
+        pprint.PrettyPrinter(indent=4).pprint(vars(args))
 
     (c, l) = get_terminal_size()
     (w, h) = get_terminal_pixel_size(c, l, RETINA_HCELL_PIXELS, RETINA_VCELL_PIXELS, RETINA_H_OFFSET, RETINA_V_OFFSET)
@@ -162,13 +175,14 @@ def main():
     alpha = check_alpha(args)
     margin = check_margin(args)
 
-    render_base_image = create_image(w, h, rgb_to_rgba(html_to_888(bg_color), 255))
     render_font = create_font(font, size)
     (render_text_width, render_text_height) = get_text_dimensions(render_font, text)
 
+    # only measuring needs the font; don't allocate the background until we know it fits
     if not fit_check(render_text_width, render_text_height, margin, w, h):
-        exit(EXIT_DOES_NOT_FIT)
+        sys.exit(EXIT_DOES_NOT_FIT)
 
+    render_base_image = create_image(w, h, html_to_888(bg_color), alpha)
     anchor = get_text_anchor_pos(position, render_text_width, render_text_height, render_base_image.size[0], render_base_image.size[1], margin)
     render_comp = composite_text(render_base_image, text, render_font, anchor, rgb_to_rgba(html_to_888(fg_color), alpha))
     render_comp.save(out_path)
@@ -179,17 +193,40 @@ def main():
 # rendering functions:
 ##############################################################################
 
+@lru_cache(maxsize=32)
 def create_font(font_name, size):
+    global ImageFont
+    if ImageFont is None:
+        from PIL import ImageFont
     return ImageFont.truetype(font_name, size)
 
-def create_image(w, h, blanking_color):
-    image = Image.new('RGBA', (w, h), blanking_color)
+def create_image(w, h, blanking_color, alpha):
+    global Image
+    if Image is None:
+        from PIL import Image
+    # the background is always opaque; an alpha channel is only needed when
+    # the text itself is translucent and has to be composited on top
+    if alpha == 255:
+        image = Image.new('RGB', (w, h), blanking_color)
+    else:
+        image = Image.new('RGBA', (w, h), rgb_to_rgba(blanking_color, 255))
     return image
 
 def composite_text(base_image, text, font_obj, anchor, color_rgba):
+    """the whole string goes to PIL in one ImageDraw.text() call, which lays
+    out and blits every glyph itself (and hands embedded newlines off to
+    multiline_text). Don't loop over characters here."""
+    global Image, ImageDraw
+    if Image is None:
+        from PIL import Image
+    if ImageDraw is None:
+        from PIL import ImageDraw
+    if base_image.mode == 'RGB':
+        # opaque text: draw straight onto the background, no overlay buffer
+        ImageDraw.Draw(base_image).text(anchor, text, font=font_obj, fill=color_rgba[:3])
+        return base_image
     text_img = Image.new('RGBA', base_image.size, (255,255,255,0))
-    drawing = ImageDraw.Draw(text_img)
-    drawing.text(anchor, text, font=font_obj, fill=color_rgba)
+    ImageDraw.Draw(text_img).text(anchor, text, font=font_obj, fill=color_rgba)
     ret = Image.alpha_composite(base_image, text_img)
     return ret
 
@@ -209,47 +246,31 @@ def fit_check(render_text_width, render_text_height, margin, w, h):
         return True
     return False
 
-def get_terminal_dimensions():
-    ts = get_terminal_size()
-    columns = ts.columns
-    lines = ts.lines
-    Logger.debug("terminal character cell dimensions measured at ({}, {})".format(columns, lines))
-    return (columns, lines)
-
 def get_terminal_pixel_size(columns, lines, h_pix, v_pix, h_offset=0, v_offset=0):
     height = lines * v_pix + v_offset
     width = columns * h_pix + h_offset
-    Logger.info("terminal dimensions: width: {} height: {}".format(width, height))
+    Logger.info("terminal dimensions: width: %s height: %s", width, height)
     return (width, height)
 
 def sanitize_html_color(code):
-    m = re.match(r'[#]?([0-9a-fA-F]{6})', code)
-    Logger.debug("santized html code {} to {}".format(code, m.group(1)))
+    m = _SANITIZE_RE.match(code)
+    Logger.debug("santized html code %s to %s", code, m.group(1))
     return m.group(1)
 
 def validate_html_color(color):
-    ret = False
-    pattern = r'[#]?[0-9a-fA-F]{6}'
-    m = re.search(pattern, color)
-    if m.group(0) == color:
-        ret = True
-    return ret
+    return _VALIDATE_RE.fullmatch(color) is not None
 
 def html_to_888(html_str):
-    pat = r'(?P<red>[0-9a-fA-F]{2})(?P<green>[0-9a-fA-F]{2})(?P<blue>[0-9a-fA-F]{2})'
-    m = re.match(pat, html_str)
-    r = hex_byte_to_int(m.group('red'))
-    g = hex_byte_to_int(m.group('green'))
-    b = hex_byte_to_int(m.group('blue'))
-    Logger.debug("converted color #{} to RGB888 ({}, {}, {})".format(html_str, r, g, b))
+    v = int(html_str.lstrip('#'), 16)
+    (r, g, b) = ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+    Logger.debug("converted color #%s to RGB888 (%d, %d, %d)", html_str, r, g, b)
     return (r,g,b)
 
-def hex_byte_to_int(hexbyte_string):
-    return int(hexbyte_string, 16)
-
 def get_text_dimensions(font_obj, text):
-    (w, h) = font_obj.getsize(text)
-    Logger.debug("measured size of text (\'{}\') is ({}, {})".format(text, w, h))
+    # like the old getsize(): the far corner of the drawn text measured from
+    # the draw origin, so the glyph offsets are included in the extent
+    (_, _, w, h) = font_obj.getbbox(text)
+    Logger.debug("measured size of text (\'%s\') is (%s, %s)", text, w, h)
     return (w, h)
 
 def get_text_anchor_pos(pos, text_w, text_h, image_w, image_h, margin=0):
@@ -300,7 +321,7 @@ def get_text_anchor_pos(pos, text_w, text_h, image_w, image_h, margin=0):
         anchor_y = centered_y
     else:
         raise RuntimeError("Not sure how we got here, but this isn't a valid position {}".format(pos))
-        exit(EXIT_CATASTROPHIC_ERROR)
+        sys.exit(EXIT_CATASTROPHIC_ERROR)
     return (anchor_x, anchor_y)
 
 def center_nested_frames(outer_w, outer_h, inner_w, inner_h):
@@ -316,55 +337,29 @@ def center_nested_frames(outer_w, outer_h, inner_w, inner_h):
 ##############################################################################
 
 def check_position(args):
-    ret = DEFAULT_POS
-    position_args = POSITION_CODES
-    for p in position_args:
-        if p in args and getattr(args, p) == True:
-            ret = p
-            break
-    Logger.info("position will be {}".format(ret))
+    ns = vars(args)
+    ret = next((p for p in POSITION_CODES if ns.get(p)), DEFAULT_POS)
+    Logger.info("position will be %s", ret)
     return ret
 
 def check_fg_color(args):
-    ret = DEFAULT_FGC
-    skip_iter = False
-    if args.f is not None:
-        if validate_html_color(args.f):
-            Logger.debug("the detected bg color is {}".format(args.f))
-            ret = args.f
-        else:
-            Logger.error("invalid bg color format given, a 6-digit hex value is required (HTML format)")
-            exit(EXIT_INVALID_FG)
-    color_args = ['f', 'fR', 'fG', 'fB', 'fW', 'fK', 'fC', 'fM', 'fY', 'fg']
-    color_in_hex = {'fR': 'FF0000', 'fG': '00FF00', 'fB': '0000FF', 'fW': 'FFFFFF', 'fK': '000000', 'fC': '00FFFF', 'fM': 'FF00ff', 'fY': 'FFFF00', 'fg': 'A9A9A9'}
-    if not skip_iter:
-        for color in color_args:
-            if getattr(args, color) == True:
-                Logger.debug("the detected fg color is: {}".format(color))
-                ret = color_in_hex[color]
-    Logger.info("background color will be {}".format(ret))
-    ret = sanitize_html_color(ret)
+    ret = _COLOR_HEX.get(args.fg)
+    if ret is None:
+        if not validate_html_color(args.fg):
+            Logger.error("invalid fg color given, a color name or a 6-digit hex value is required (HTML format)")
+            sys.exit(EXIT_INVALID_FG)
+        ret = sanitize_html_color(args.fg)
+    Logger.info("foreground color will be %s", ret)
     return ret
 
 def check_bg_color(args):
-    ret = DEFAULT_BGC
-    skip_iter = False
-    if args.b is not None:
-        if validate_html_color(args.b):
-            Logger.debug("the detected bg color is {}".format(args.b))
-            ret = args.b
-        else:
-            Logger.error("invalid bg color format given, a 6-digit hex value is required (HTML format)")
-            exit(EXIT_INVALID_BG)
-    color_args = ['bR', 'bG', 'bB', 'bW', 'bK', 'bC', 'bM', 'bY', 'bg']
-    color_in_hex = {'bR': 'FF0000', 'bG': '00FF00', 'bB': '0000FF', 'bW': 'FFFFFF', 'bK': '000000', 'bC': '00FFFF', 'bM': 'FF00ff', 'bY': 'FFFF00', 'bg': 'A9A9A9'}
-    if not skip_iter:
-        for color in color_args:
-            if getattr(args, color) == True:
-                Logger.debug("the detected bg color is: {}".format(color))
-                ret = color_in_hex[color]
-    Logger.info("background color will be {}".format(ret))
-    ret = sanitize_html_color(ret)
+    ret = _COLOR_HEX.get(args.bg)
+    if ret is None:
+        if not validate_html_color(args.bg):
+            Logger.error("invalid bg color given, a color name or a 6-digit hex value is required (HTML format)")
+            sys.exit(EXIT_INVALID_BG)
+        ret = sanitize_html_color(args.bg)
+    Logger.info("background color will be %s", ret)
     return ret
 
 def check_alpha(args):
@@ -376,7 +371,7 @@ def check_alpha(args):
         a = 0
         Logger.info("clamping alpha to 0 (what are you doing?)")
     else:
-        Logger.info("alpha will be {}".format(a))
+        Logger.info("alpha will be %s", a)
     return a
 
 def check_margin(args):
@@ -389,19 +384,17 @@ def check_margin(args):
         Logger.info("clamping margin to 0")
     elif ret > MAX:
         ret = MAX
-        Logger.info("clamping margin to {}} (what are you doing?)".format(MAX))
+        Logger.info("clamping margin to %s (what are you doing?)", MAX)
     else:
-        Logger.info("margin will be {}".format(ret))
+        Logger.info("margin will be %s", ret)
     return ret
 
 def check_output_file(args):
     if not args.out_path:
-        fallback = tempfile.NamedTemporaryFile(dir='/tmp/')
-        fallback.close() # heh, gross hack to just get some random path
-        ret = fallback.name + '.png'
+        ret = f"/tmp/terminal_tattoo_{urandom(8).hex()}.png"
     else:
         ret = args.out_path
-    Logger.info("Output file for image is {}".format(ret))
+    Logger.info("Output file for image is %s", ret)
     return ret
 
 def check_font(args):
@@ -415,69 +408,157 @@ def check_font(args):
         ret = args.font
     else:
         ret = DEFAULT_FONT
-    Logger.info("font will be {}".format(ret))
+    Logger.info("font will be %s", ret)
     return ret
 
 def check_size(args):
     ret = DEFAULT_SIZE
     if args.s:
         ret = args.s
-    Logger.info("text will be point size {}".format(ret))
+    Logger.info("text will be point size %s", ret)
     return ret
 
 
 ##############################################################################
-# argparse:
+# command line parsing:
 ##############################################################################
 
+# (flags, dest, kind, default, metavar, help, exclusive group)
+# kind is one of 'int', 'str', 'bool', 'count', 'help'. Flags sharing a
+# non-None group are mutually exclusive. Table order is --help order.
+_FLAGS = (
+    (('-h', '--help'),     'help',     'help',  None, None,     'show this help message and exit', None),
+    (('-s',),              's',        'int',   None, 'POINTS', 'point size of the text', None),
+    (('--font',),          'font',     'str',   None, 'PATH',   'font to use for the watermark', None),
+    (('--verbose', '-v'),  'verbose',  'count', 0,    None,     'verbose mode (can be repeated)', None),
+    (('-o',),              'out_path', 'str',   None, 'PATH',   'output file for the rendered image', None),
+    (('--alpha', '-a'),    'alpha',    'int',   255,  'ALPHA',  'alpha value of text', None),
+
+    (('--pT',),  'pT',  'bool', False, None, 'top center', 'position'),
+    (('--pTL',), 'pTL', 'bool', False, None, 'top left', 'position'),
+    (('--pTR',), 'pTR', 'bool', False, None, 'top right', 'position'),
+    (('--pB',),  'pB',  'bool', False, None, 'bottom center', 'position'),
+    (('--pBL',), 'pBL', 'bool', False, None, 'bottom left', 'position'),
+    (('--pBR',), 'pBR', 'bool', False, None, 'bottom right', 'position'),
+    (('--pC',),  'pC',  'bool', False, None, 'center', 'position'),
+    (('--pL',),  'pL',  'bool', False, None, 'left center', 'position'),
+    (('--pR',),  'pR',  'bool', False, None, 'right center', 'position'),
+
+    (('--margin',), 'margin', 'int', 25, 'PIXELS', 'no-text perimeter width', None),
+
+    (('--fg',), 'fg', 'str', DEFAULT_FGC, 'COLOR', 'text color: {} or RRGGBB'.format(', '.join(_COLOR_HEX)), None),
+    (('--bg',), 'bg', 'str', DEFAULT_BGC, 'COLOR', 'background color: {} or RRGGBB'.format(', '.join(_COLOR_HEX)), None),
+)
+
+_FLAG_LOOKUP = {flag: entry for entry in _FLAGS for flag in entry[0]}
+
+
+class FlagParser(object):
+    """a small table-driven stand-in for argparse.ArgumentParser. The flag
+    surface of this tool is fixed, so one pass over argv against _FLAGS is
+    all the parsing we need. parse_args() returns a namespace with the same
+    attribute names argparse would have produced."""
+
+    def __init__(self, prog, description, epilog):
+        self.prog = prog
+        self.description = description
+        self.epilog = epilog
+
+    def format_usage(self):
+        return 'usage: {} [options] text [text ...]\n'.format(self.prog)
+
+    def format_help(self):
+        lines = [self.format_usage(), self.description, '', 'positional arguments:',
+                 '  {:<22}{}'.format('text', 'Text to use in the watermark'), '', 'options:']
+        for (flags, _, _, _, metavar, help_text, _) in _FLAGS:
+            spec = ', '.join(flags)
+            if metavar:
+                spec += ' ' + metavar
+            lines.append('  {:<22}{}'.format(spec, help_text))
+        lines += ['', self.epilog, '']
+        return '\n'.join(lines)
+
+    def error(self, message):
+        sys.stderr.write(self.format_usage())
+        sys.stderr.write('{}: error: {}\n'.format(self.prog, message))
+        sys.exit(2)
+
+    def _lookup(self, token):
+        """exact match, or (like argparse) a unique prefix of a long option"""
+        entry = _FLAG_LOOKUP.get(token)
+        if entry is not None or not token.startswith('--'):
+            return entry
+        matches = [flag for flag in _FLAG_LOOKUP if flag.startswith('--') and flag.startswith(token)]
+        if len(matches) > 1:
+            self.error('ambiguous option: {} could match {}'.format(token, ', '.join(matches)))
+        return _FLAG_LOOKUP[matches[0]] if matches else None
+
+    def parse_args(self, args=None):
+        if args is None:
+            args = sys.argv[1:]
+        ns = SimpleNamespace(**{entry[1]: entry[3] for entry in _FLAGS if entry[2] != 'help'})
+        ns.text = []
+        seen_groups = {}
+        i = 0
+        n = len(args)
+        while i < n:
+            token = args[i]
+            i += 1
+            if token == '--':
+                ns.text.extend(args[i:])
+                break
+            if len(token) < 2 or token[0] != '-':
+                ns.text.append(token)
+                continue
+            value = None
+            if token.startswith('--') and '=' in token:
+                (token, value) = token.split('=', 1)
+            entry = self._lookup(token)
+            if entry is None and not token.startswith('--'):
+                attached = _FLAG_LOOKUP.get(token[:2])
+                if attached is not None and attached[2] == 'count' and token[1:] == token[1] * (len(token) - 1):
+                    # stacked count flags, e.g. -vvv
+                    setattr(ns, attached[1], getattr(ns, attached[1]) + len(token) - 1)
+                    continue
+                if attached is not None and attached[2] in ('int', 'str'):
+                    # value glued onto a short option, e.g. -s45
+                    (entry, value) = (attached, token[2:])
+            if entry is None:
+                self.error('unrecognized arguments: {}'.format(token))
+            (flags, dest, kind, _, _, _, group) = entry
+            token = '/'.join(flags)
+            if group is not None:
+                other = seen_groups.setdefault(group, token)
+                if other != token:
+                    self.error('argument {}: not allowed with argument {}'.format(token, other))
+            if kind == 'help':
+                sys.stdout.write(self.format_help())
+                sys.exit(0)
+            if kind in ('bool', 'count'):
+                if value is not None:
+                    self.error('argument {}: ignored explicit argument \'{}\''.format(token, value))
+                setattr(ns, dest, True if kind == 'bool' else getattr(ns, dest) + 1)
+                continue
+            if value is None:
+                if i >= n:
+                    self.error('argument {}: expected one argument'.format(token))
+                value = args[i]
+                i += 1
+            if kind == 'int':
+                try:
+                    value = int(value)
+                except ValueError:
+                    self.error('argument {}: invalid int value: \'{}\''.format(token, value))
+            setattr(ns, dest, value)
+        if not ns.text:
+            self.error('the following arguments are required: text')
+        return ns
+# End Class FlagParser
+
+
 def config_parser():
-    parser = argparse.ArgumentParser(description='Render an image for a watermarked Terminal window.', \
-        epilog='Defaults to {}, size {}, black text on white, positioned in the top right corner.'.format(path.basename(DEFAULT_FONT), DEFAULT_SIZE))
-    parser.add_argument('text', type=str, nargs='+', help='Text to use in the watermark')
-    parser.add_argument('-s', metavar='POINTS', type=int, help='point size of the text')
-    parser.add_argument('--font', metavar='PATH', help='font to use for the watermark')
-    parser.add_argument('--verbose', '-v', action='count', help='verbose mode (can be repeated)', default=0)
-    parser.add_argument('-o', metavar='PATH', dest='out_path', help='output file for the rendered image')
-    parser.add_argument('--alpha', '-a', type=int, metavar='ALPHA', default=255, help='alpha value of text')
-
-    position = parser.add_mutually_exclusive_group()
-    position.add_argument('--pT',  action='store_true', help='top center')
-    position.add_argument('--pTL', action='store_true', help='top left')
-    position.add_argument('--pTR', action='store_true', help='top right')
-    position.add_argument('--pB',  action='store_true', help='bottom center')
-    position.add_argument('--pBL', action='store_true', help='bottom left')
-    position.add_argument('--pBR', action='store_true', help='bottom right')
-    position.add_argument('--pC',  action='store_true', help='center')
-    position.add_argument('--pL',  action='store_true', help='left center')
-    position.add_argument('--pR',  action='store_true', help='right center')
-
-    parser.add_argument('--margin', type=int, metavar='PIXELS', default=25, help='no-text perimeter width')
-
-    fgColor = parser.add_mutually_exclusive_group()
-    fgColor.add_argument('--fR', action='store_true', help='red')
-    fgColor.add_argument('--fG', action='store_true', help='green')
-    fgColor.add_argument('--fB', action='store_true', help='blue')
-    fgColor.add_argument('--fW', action='store_true', help='white')
-    fgColor.add_argument('--fK', action='store_true', help='black')
-    fgColor.add_argument('--fC', action='store_true', help='cyan')
-    fgColor.add_argument('--fM', action='store_true', help='magenta')
-    fgColor.add_argument('--fY', action='store_true', help='yellow')
-    fgColor.add_argument('--fg', action='store_true', help='medium gray')
-    fgColor.add_argument('--f', metavar='RRGGBB', help='arbitrary color in HTML format')
-
-    bgColor = parser.add_mutually_exclusive_group()
-    bgColor.add_argument('--bR', action='store_true', help='red')
-    bgColor.add_argument('--bG', action='store_true', help='green')
-    bgColor.add_argument('--bB', action='store_true', help='blue')
-    bgColor.add_argument('--bW', action='store_true', help='white')
-    bgColor.add_argument('--bK', action='store_true', help='black')
-    bgColor.add_argument('--bC', action='store_true', help='cyan')
-    bgColor.add_argument('--bM', action='store_true', help='magenta')
-    bgColor.add_argument('--bY', action='store_true', help='yellow')
-    bgColor.add_argument('--bg', action='store_true', help='medium gray')
-    bgColor.add_argument('--b', metavar='RRGGBB', help='arbitrary color in HTML format')
-
-    return parser
+    return FlagParser(path.basename(sys.argv[0]), 'Render an image for a watermarked Terminal window.', \
+        'Defaults to {}, size {}, black text on white, positioned in the top right corner.'.format(path.basename(DEFAULT_FONT), DEFAULT_SIZE))
 
 
 if __name__ == '__main__':
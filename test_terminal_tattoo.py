@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+#
+# test_terminal_tattoo.py
+#
+# Command line parsing checks for terminal_tattoo.FlagParser
+# run with: python -m unittest test_terminal_tattoo
+
+import io
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+import terminal_tattoo
+
+
+def parse(*argv):
+    return terminal_tattoo.config_parser().parse_args(list(argv))
+
+
+class FlagParserTest(unittest.TestCase):
+    def assertUsageError(self, *argv):
+        with redirect_stderr(io.StringIO()) as err:
+            with self.assertRaises(SystemExit) as cm:
+                parse(*argv)
+        self.assertEqual(cm.exception.code, 2)
+        return err.getvalue()
+
+    def test_defaults(self):
+        args = parse('hello')
+        self.assertEqual(args.text, ['hello'])
+        self.assertIsNone(args.s)
+        self.assertEqual(args.verbose, 0)
+        self.assertEqual(args.alpha, 255)
+        self.assertEqual(args.margin, 25)
+        self.assertFalse(args.pT)
+
+    def test_text_is_required(self):
+        self.assertIn('required: text', self.assertUsageError())
+
+    def test_separate_values(self):
+        args = parse('-s', '45', '-o', '/tmp/x.png', '--alpha', '128', 'hi')
+        self.assertEqual((args.s, args.out_path, args.alpha), (45, '/tmp/x.png', 128))
+
+    def test_attached_short_values(self):
+        args = parse('-s45', '-a128', '-o/tmp/x.png', 'hi')
+        self.assertEqual((args.s, args.out_path, args.alpha), (45, '/tmp/x.png', 128))
+
+    def test_equals_values(self):
+        args = parse('--alpha=12', '--margin=3', 'hi')
+        self.assertEqual((args.alpha, args.margin), (12, 3))
+
+    def test_long_option_prefixes(self):
+        args = parse('--marg', '3', '--verb', '--alp', '9', 'hi')
+        self.assertEqual((args.margin, args.verbose, args.alpha), (3, 1, 9))
+
+    def test_ambiguous_prefix(self):
+        self.assertIn('ambiguous option', self.assertUsageError('--p', 'hi'))
+
+    def test_exact_match_beats_prefix(self):
+        self.assertTrue(parse('--pT', 'hi').pT)
+        self.assertFalse(parse('--pT', 'hi').pTL)
+
+    def test_stacked_verbose(self):
+        self.assertEqual(parse('-vvv', 'hi').verbose, 3)
+        self.assertEqual(parse('-v', '--verbose', '-vv', 'hi').verbose, 4)
+
+    def test_exclusive_group(self):
+        self.assertIn('not allowed with', self.assertUsageError('--pT', '--pBL', 'hi'))
+        self.assertTrue(parse('--pT', '--pT', 'hi').pT)
+
+    def test_double_dash_ends_options(self):
+        args = parse('hi', '--', '-s', '--pT')
+        self.assertEqual(args.text, ['hi', '-s', '--pT'])
+        self.assertIsNone(args.s)
+        self.assertFalse(args.pT)
+
+    def test_bad_values(self):
+        self.assertIn('invalid int value', self.assertUsageError('-sq', 'hi'))
+        self.assertIn('expected one argument', self.assertUsageError('hi', '-o'))
+        self.assertIn('ignored explicit argument', self.assertUsageError('--pT=1', 'hi'))
+        self.assertIn('unrecognized arguments', self.assertUsageError('--nope', 'hi'))
+
+    def test_color_options(self):
+        args = parse('hi')
+        self.assertEqual(terminal_tattoo.check_fg_color(args), '000000')
+        self.assertEqual(terminal_tattoo.check_bg_color(args), 'FFFFFF')
+        args = parse('--fg', 'gray', '--bg=#203040', 'hi')
+        self.assertEqual(terminal_tattoo.check_fg_color(args), 'A9A9A9')
+        self.assertEqual(terminal_tattoo.check_bg_color(args), '203040')
+        with self.assertRaises(SystemExit) as cm:
+            terminal_tattoo.check_fg_color(parse('--fg', 'purple', 'hi'))
+        self.assertEqual(cm.exception.code, terminal_tattoo.EXIT_INVALID_FG)
+
+    def test_help(self):
+        with redirect_stdout(io.StringIO()) as out:
+            with self.assertRaises(SystemExit) as cm:
+                parse('-h')
+        self.assertEqual(cm.exception.code, 0)
+        self.assertIn('--margin PIXELS', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()